@@ -23,14 +23,107 @@ ValueError
 
 import os
 import sqlite3
+import functools
+import multiprocessing
 from loguru import logger
 from dotenv import load_dotenv
-from cryptography.fernet import Fernet
+
+# Prefer the Rust-backed rfernet implementation when available; it is
+# API-compatible with cryptography's Fernet and several times faster on the
+# small payloads (phone/email/location) this script decrypts.
+try:
+    from rfernet import Fernet
+except ImportError:
+    from cryptography.fernet import Fernet
 
 # Load environment variables
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=4)
+def _build_cipher(key: str):
+    """
+    Build and memoize a Fernet cipher for a key.
+
+    Key parsing is invariant per process, so repeated manager construction
+    within one run reuses the same cipher. Failures are not cached.
+    """
+    try:
+        return Fernet(key.encode())
+    except TypeError:
+        # rfernet takes the base64 key as str rather than bytes
+        return Fernet(key)
+
+
+# Per-process bound decrypt method for workers; set once by _init_worker so
+# each worker parses and validates the key a single time.
+_WORKER_DECRYPT = None
+
+
+def _init_worker(key: str) -> None:
+    """Build one Fernet instance per worker process and cache its decrypt."""
+    global _WORKER_DECRYPT
+    _WORKER_DECRYPT = _build_cipher(key).decrypt
+
+
+def _decrypt_update_row(row: tuple) -> tuple:
+    """
+    Decrypt the sensitive fields of a source row in a worker process.
+
+    Parameters
+    ----------
+    row : tuple
+        A row in SELECT order: id, phone_number, email, current_location.
+
+    Returns
+    -------
+    tuple
+        A pair of (UPDATE parameters, failure count). The parameters are the
+        decrypted phone number, email, and current location followed by the
+        row id; fields that fail to decrypt are passed through unchanged and
+        counted, so the parent process can aggregate failures across workers.
+    """
+    fails = 0
+    values = []
+    for value in row[1:]:
+        # Empty fields skip the decrypt call entirely
+        if not value:
+            values.append("")
+            continue
+        try:
+            values.append(_WORKER_DECRYPT(value.encode()).decode())
+        except Exception:
+            fails += 1
+            values.append(value)
+    return tuple(values) + (row[0],), fails
+
+
+def _warn_if_no_aesni() -> None:
+    """
+    Warn when the CPU lacks hardware AES support.
+
+    Fernet's AES-CBC is the hot inner loop of the migration; without AES-NI
+    the block cipher runs on the much slower software path. This check is
+    purely diagnostic so deployers can fix their base image.
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            cpuinfo = f.read()
+    except OSError:
+        # Not Linux (or /proc unavailable); nothing reliable to probe.
+        return
+
+    for line in cpuinfo.splitlines():
+        if line.startswith("flags") or line.startswith("Features"):
+            if "aes" in line.split():
+                return
+            break
+    logger.warning(
+        "AES-NI not detected on this CPU; Fernet decryption will fall back "
+        "to software AES and run several times slower."
+    )
+
+
 class DecryptionManager:
     """
     Handles decryption of sensitive data using Fernet symmetric encryption.
@@ -46,13 +139,20 @@ class DecryptionManager:
         ValueError
             If `ENCRYPTION_KEY` is missing or invalid.
         """
+        _warn_if_no_aesni()
         key = os.getenv("ENCRYPTION_KEY")
         if not key:
             logger.error("ENCRYPTION_KEY not found in environment variables")
             raise ValueError("ENCRYPTION_KEY not found in environment variables")
+        self.key = key
+        # Failures are counted rather than logged per-row: a warning per bad
+        # token would both flood the log and leak field contents.
+        self.fail_count = 0
 
         try:
-            self.cipher_suite = Fernet(key.encode())
+            self.cipher_suite = _build_cipher(key)
+            # Cache the bound method so hot loops skip repeated lookups
+            self._decrypt = self.cipher_suite.decrypt
         except Exception as e:
             logger.exception(
                 "Invalid ENCRYPTION_KEY format. Must be a 32-byte base64 URL-safe string."
@@ -77,19 +177,51 @@ class DecryptionManager:
 
         Notes
         -----
-        This method logs a warning if decryption fails.
+        Failures increment `fail_count` instead of logging per-row, so
+        degenerate data neither floods the log nor leaks field contents.
         """
         if not text:
             return ""
         try:
-            decrypted_text = self.cipher_suite.decrypt(text.encode())
+            decrypted_text = self._decrypt(text.encode())
             return decrypted_text.decode()
-        except Exception as e:
-            logger.warning(
-                f"Decryption failed for text: {text}. Returning original text. Error: {e}"
-            )
+        except Exception:
+            self.fail_count += 1
             return text
 
+    def decrypt_many(self, texts: list[str | None]) -> list[str]:
+        """
+        Decrypt a batch of text strings in one call.
+
+        Parameters
+        ----------
+        texts : list of str or None
+            The texts to decrypt. Empty or None entries map to empty strings.
+
+        Returns
+        -------
+        list of str
+            The decrypted strings, in input order. Entries that fail to
+            decrypt are returned unchanged, mirroring `decrypt`.
+
+        Notes
+        -----
+        Amortizes the per-call attribute lookups of `decrypt` across the
+        batch by using the cipher's bound decrypt method directly.
+        """
+        decrypt = self._decrypt
+        results = []
+        for text in texts:
+            if not text:
+                results.append("")
+                continue
+            try:
+                results.append(decrypt(text.encode()).decode())
+            except Exception:
+                self.fail_count += 1
+                results.append(text)
+        return results
+
 
 class DatabaseDecryptor:
     """
@@ -118,6 +250,30 @@ class DatabaseDecryptor:
         self.decryption_manager = DecryptionManager()
         self._create_target_table()
 
+    @staticmethod
+    def _tune(conn: sqlite3.Connection) -> None:
+        """
+        Apply performance PRAGMAs to a connection.
+
+        WAL journaling with `synchronous=NORMAL` halves the fsync cost per
+        commit, while the in-memory temp store and larger page cache keep the
+        migration's working set off disk.
+        """
+        conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            """
+        )
+        try:
+            # Serve reads through mmap instead of pread where the build
+            # supports it (256MB window).
+            conn.execute("PRAGMA mmap_size=268435456")
+        except sqlite3.Error:
+            logger.debug("mmap_size not supported by this SQLite build.")
+
     def _create_target_table(self) -> None:
         """
         Create the `candidates` table in the target database if it does not exist.
@@ -129,6 +285,10 @@ class DatabaseDecryptor:
             f"Creating table 'candidates' in target database '{self.target_db}' if it doesn't exist."
         )
         with sqlite3.connect(self.target_db) as conn:
+            # Must run before the first table is created for the larger page
+            # size to take effect on a fresh database.
+            conn.execute("PRAGMA page_size=8192")
+            self._tune(conn)
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -159,64 +319,98 @@ class DatabaseDecryptor:
 
         Notes
         -----
-        - Non-sensitive fields are copied as-is.
+        - The source database is ATTACHed and all columns are bulk-copied with
+          one `INSERT ... SELECT`, so non-sensitive data never crosses the
+          Python boundary; the three sensitive columns are then overwritten
+          with decrypted values via a single batched `UPDATE`.
+        - Everything runs inside one transaction, costing a single commit.
+        - Sensitive rows are streamed in fixed-size batches via `fetchmany`,
+          so memory stays bounded regardless of table size.
         - Logs the total number of records migrated.
         """
         logger.info(
             f"Starting data migration from '{self.source_db}' to '{self.target_db}'."
         )
-        with (
-            sqlite3.connect(self.source_db) as source_conn,
-            sqlite3.connect(self.target_db) as target_conn,
-        ):
-            source_cursor = source_conn.cursor()
+        # Pool.imap consumes its input iterable on the Pool's task-handler
+        # thread, so the fetchmany generator below runs off the main thread;
+        # the connection must allow that. SQLite's default serialized
+        # threading mode keeps the interleaved cursor use safe.
+        with sqlite3.connect(self.target_db, check_same_thread=False) as target_conn:
+            self._tune(target_conn)
+            # Manage the transaction explicitly so sqlite3 cannot sneak in an
+            # automatic COMMIT mid-batch; one cursor lives for the whole
+            # migration so the prepared statements are reused throughout.
+            target_conn.isolation_level = None
             target_cursor = target_conn.cursor()
+            target_cursor.execute("PRAGMA cache_spill=OFF")
+            target_cursor.execute("ATTACH DATABASE ? AS src", (self.source_db,))
+            target_cursor.execute("BEGIN IMMEDIATE")
+
+            # Bulk-copy every column inside SQLite — the six non-sensitive
+            # fields never cross the Python boundary. Source ids are kept so
+            # the decrypted UPDATEs below can address their rows.
+            target_cursor.execute(
+                """
+                INSERT INTO candidates
+                (id, date_time, name, phone_number, email, current_location,
+                 experience_years, desired_positions, tech_stack, technical_responses_json)
+                SELECT id, date_time, name, phone_number, email, current_location,
+                       experience_years, desired_positions, tech_stack,
+                       technical_responses_json
+                FROM src.candidates
+                """
+            )
+            migrated = target_cursor.rowcount
 
-            source_cursor.execute("SELECT * FROM candidates")
-            rows = source_cursor.fetchall()
-            logger.info(f"Found {len(rows)} records to migrate.")
-
-            for row in rows:
-                (
-                    id,
-                    date_time,
-                    name,
-                    phone_number,
-                    email,
-                    current_location,
-                    experience_years,
-                    desired_positions,
-                    tech_stack,
-                    technical_responses_json,
-                ) = row
-
-                # Decrypt sensitive fields
-                decrypted_phone = self.decryption_manager.decrypt(phone_number)
-                decrypted_email = self.decryption_manager.decrypt(email)
-                decrypted_location = self.decryption_manager.decrypt(current_location)
-
-                # Insert into new DB
-                target_cursor.execute(
+            source_cursor = target_conn.cursor()
+            source_cursor.execute(
+                "SELECT id, phone_number, email, current_location FROM src.candidates"
+            )
+
+            def row_iter():
+                while True:
+                    batch = source_cursor.fetchmany(1000)
+                    if not batch:
+                        return
+                    yield from batch
+
+            # Per-worker failure counts cannot cross the process boundary, so
+            # each result carries its count and the parent aggregates here.
+            def update_params(results):
+                for params, fails in results:
+                    if fails:
+                        self.decryption_manager.fail_count += fails
+                    yield params
+
+            # Fan decryption out across cores; SQLite allows only one writer,
+            # so the UPDATE stream stays on this process. imap (unlike
+            # Executor.map, which drains its input into pending futures up
+            # front) pulls rows lazily as workers free up, keeping the
+            # in-flight window bounded.
+            with multiprocessing.Pool(
+                processes=os.cpu_count(),
+                initializer=_init_worker,
+                initargs=(self.decryption_manager.key,),
+            ) as pool:
+                target_cursor.executemany(
                     """
-                    INSERT INTO candidates
-                    (date_time, name, phone_number, email, current_location,
-                     experience_years, desired_positions, tech_stack, technical_responses_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    UPDATE candidates
+                    SET phone_number = ?, email = ?, current_location = ?
+                    WHERE id = ?
                     """,
-                    (
-                        date_time,
-                        name,
-                        decrypted_phone,
-                        decrypted_email,
-                        decrypted_location,
-                        experience_years,
-                        desired_positions,
-                        tech_stack,
-                        technical_responses_json,
+                    update_params(
+                        pool.imap(_decrypt_update_row, row_iter(), chunksize=256)
                     ),
                 )
 
             target_conn.commit()
+            target_cursor.execute("DETACH DATABASE src")
+            logger.info(f"Migrated {migrated} records.")
+            if self.decryption_manager.fail_count:
+                logger.warning(
+                    f"{self.decryption_manager.fail_count} fields failed to "
+                    "decrypt and were copied unchanged."
+                )
         logger.info("Data migration completed successfully.")
 
 
@@ -26,6 +26,7 @@ import re
 import base64
 import secrets
 import argparse
+import functools
 from pathlib import Path
 from loguru import logger
 
@@ -34,6 +35,12 @@ ENV_VAR_NAME = "ENCRYPTION_KEY"
 ENV_FILE = Path(".env")
 
 
+@functools.lru_cache(maxsize=64)
+def _get_pattern(key: str) -> re.Pattern:
+    """Compile (once per variable name) the pattern matching its `.env` line."""
+    return re.compile(rf"^(?:\s*export\s+)?{re.escape(key)}=(.*)$", re.MULTILINE)
+
+
 def generate_key() -> str:
     """
     Generate a random encryption key.
@@ -93,32 +100,31 @@ def write_env(path: Path, content: str) -> None:
 
 def insert_env_var(content: str, key: str, value: str) -> str:
     """
-    Insert or update an environment variable in `.env` content.
+    Insert or update an environment variable line in `.env` content.
 
     Parameters
     ----------
     content : str
         Existing `.env` file content.
     key : str
-        The environment variable name to insert or update.
+        The variable name; its compiled line pattern is cached per name.
     value : str
-        The value of the environment variable.
+        The value to set for the variable.
 
     Returns
     -------
     str
-        Updated `.env` file content with the key/value inserted or replaced.
+        Updated `.env` file content with the line inserted or replaced.
     """
-    pattern = re.compile(rf"^(?:\s*export\s+)?{re.escape(key)}=.*$", re.MULTILINE)
-    line = f"{key}={value}"
-    if pattern.search(content):
-        logger.info(f"Updating existing key '{key}' in .env content.")
-        return pattern.sub(line, content, count=1)
+    new_content, n = _get_pattern(key).subn(f"{key}={value}", content, count=1)
+    if n:
+        logger.info(f"Updating existing line '{key}' in .env content.")
+        return new_content
 
-    logger.info(f"Inserting new key '{key}' into .env content.")
+    logger.info(f"Inserting new line '{key}' into .env content.")
     if content and not content.endswith("\n"):
         content += "\n"
-    return content + line + "\n"
+    return content + f"{key}={value}\n"
 
 
 def main() -> None:
@@ -154,13 +160,12 @@ def main() -> None:
 
     env_content = read_env(ENV_FILE)
 
-    existing_match = re.search(
-        rf"^(?:\s*export\s+)?{re.escape(ENV_VAR_NAME)}=(.+)$",
-        env_content,
-        re.MULTILINE,
-    )
+    existing_match = _get_pattern(ENV_VAR_NAME).search(env_content)
+    # A bare "ENCRYPTION_KEY=" line matches the pattern but carries no key;
+    # only a non-empty value counts as an existing key worth protecting.
+    has_existing_key = bool(existing_match and existing_match.group(1).strip())
 
-    if existing_match and not args.force:
+    if has_existing_key and not args.force:
         logger.warning(
             f"{ENV_VAR_NAME} already present in {ENV_FILE}. Use --force to overwrite."
         )
@@ -194,7 +199,7 @@ def main() -> None:
         write_env(ENV_FILE, new_content)
 
     logger.info(
-        f"Wrote {ENV_VAR_NAME} to {ENV_FILE}{' (overwritten)' if existing_match else ''}."
+        f"Wrote {ENV_VAR_NAME} to {ENV_FILE}{' (overwritten)' if has_existing_key else ''}."
     )
 
 
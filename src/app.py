@@ -13,8 +13,16 @@ sys.path.insert(0, project_root)
 
 from src.core.conversation_manager import ConversationManager
 
+
+@st.cache_resource
+def _load_env_once() -> bool:
+    """Load `.env` once per process instead of re-parsing it every rerun."""
+    load_dotenv()
+    return True
+
+
 # Load environment variables
-load_dotenv()
+_load_env_once()
 
 # Add logo path
 logo_path = Path(project_root) / "src" / "logo"
@@ -44,17 +52,9 @@ def check_environment() -> bool:
     return True
 
 
-def setup_page_config():
-    """Configure Streamlit page settings and custom CSS."""
-    logger.info("Setting up Streamlit page configuration.")
-    st.set_page_config(
-        page_title="TalentScout Hiring Assistant",
-        page_icon=logo_path / "bot.png",
-        layout="wide",
-        initial_sidebar_state="expanded",
-    )
-    st.markdown(
-        """
+# Static stylesheet; built once at module level so reruns only pay for the
+# st.markdown call, not for reassembling the blob.
+_CSS = """
     <style>
     .main > div { padding: 2rem 1rem; }
     .stApp > header { background-color: transparent; }
@@ -77,9 +77,21 @@ def setup_page_config():
     .status-completed { background-color: #10b981; color: white; }
     div[data-testid="stSidebar"] > div { padding: 1rem; }
     </style>
-    """,
-        unsafe_allow_html=True,
+    """
+
+
+def setup_page_config():
+    """Configure Streamlit page settings and custom CSS."""
+    logger.info("Setting up Streamlit page configuration.")
+    st.set_page_config(
+        page_title="TalentScout Hiring Assistant",
+        page_icon=logo_path / "bot.png",
+        layout="wide",
+        initial_sidebar_state="expanded",
     )
+    # Streamlit drops elements that are not re-emitted on a rerun, so the
+    # stylesheet must be injected every cycle to stay in the page.
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def initialize_session_state():
@@ -101,6 +113,12 @@ def initialize_session_state():
             )
             st.session_state.messages = []  # Reset the list to fix the error
 
+    # Normalize any stray timestamp types once here so the render loop can
+    # format them unconditionally.
+    for message in st.session_state.get("messages", []):
+        if not isinstance(message.get("timestamp"), datetime):
+            message["timestamp"] = datetime.now()
+
     # Initialize messages list if it's empty
     if "messages" not in st.session_state or not st.session_state.messages:
         logger.info("Initializing messages list for the new session.")
@@ -115,7 +133,7 @@ def initialize_session_state():
         )
 
 
-def render_sidebar():
+def render_sidebar(state_info):
     """Render the sidebar with progress tracking and candidate information."""
     with st.sidebar:
         st.markdown("### 📌 What to Expect")
@@ -130,7 +148,6 @@ def render_sidebar():
         )
 
         st.markdown("### 🔎 Screening Progress")
-        state_info = st.session_state.conversation_manager.get_conversation_state()
         progress = state_info["completion_percentage"]
         col1, col2 = st.columns([3, 1])
         with col1:
@@ -151,14 +168,15 @@ def render_sidebar():
         )
 
 
+@st.cache_data(show_spinner=False)
 def get_image_as_base64(file):
-    """Reads an image file and returns its Base64 encoded string."""
+    """Reads an image file and returns its Base64 encoded string (cached)."""
     with open(file, "rb") as f:
         data = f.read()
     return base64.b64encode(data).decode()
 
 
-def render_chat_interface():
+def render_chat_interface(state_info):
     """Render the main chat interface and handle message flow."""
     # Header
     logo_base64 = get_image_as_base64(logo_path / "bot.png")
@@ -175,27 +193,27 @@ def render_chat_interface():
         "Welcome to our automated screening process! I'll guide you through a brief interview."
     )
 
-    # Render existing messages
+    # Render existing messages; avatars are immutable, so encode each once
+    # per role instead of once per message.
+    avatar_html_by_role = {
+        role: (
+            f'<img src="data:image/png;base64,'
+            f'{get_image_as_base64(logo_path / f"{role}.png")}" width="48" height="48">'
+        )
+        for role in ("assistant", "user")
+    }
+    html_parts = []
     for message in st.session_state.messages:
         role = message["role"]
-        avatar_path = (
-            logo_path / "assistant.png"
-            if role == "assistant"
-            else logo_path / "user.png"
-        )
-        avatar_base64 = get_image_as_base64(avatar_path)
-        avatar_html = (
-            f'<img src="data:image/png;base64,{avatar_base64}" width="48" height="48">'
-        )
+        avatar_html = avatar_html_by_role[
+            "assistant" if role == "assistant" else "user"
+        ]
         bubble_class = "assistant" if role == "assistant" else "user"
 
-        # Check if timestamp is a valid datetime object before formatting
-        if isinstance(message["timestamp"], datetime):
-            timestamp = message["timestamp"].strftime("%H:%M")
-        else:
-            timestamp = ""  # Fallback for any unexpected type
+        # Timestamps are normalized to datetime in initialize_session_state
+        timestamp = message["timestamp"].strftime("%H:%M")
 
-        st.markdown(
+        html_parts.append(
             f"""
             <div class="chat-row {bubble_class}">
                 <div class="chat-avatar {bubble_class}">{avatar_html}</div>
@@ -204,12 +222,15 @@ def render_chat_interface():
                     <div class="chat-timestamp">{timestamp}</div>
                 </div>
             </div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
 
+    # One markdown call for the whole history: a single component update
+    # instead of one per message.
+    if html_parts:
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
+
     # Handle new input if screening is not completed
-    state_info = st.session_state.conversation_manager.get_conversation_state()
     if state_info["state"] != "exit":
         # Use a flag to disable input while the assistant is generating a response
         input_disabled = st.session_state.get("needs_response", False)
@@ -253,9 +274,8 @@ def render_chat_interface():
         )
 
 
-def render_completion_summary():
+def render_completion_summary(state_info):
     """Render completion summary if screening is done."""
-    state_info = st.session_state.conversation_manager.get_conversation_state()
     if state_info["state"] == "exit":
         logger.info("Rendering completion summary.")
         st.markdown(
@@ -272,13 +292,19 @@ def main():
     """Main application function."""
     logger.info("Starting main application function.")
     setup_page_config()
-    if not check_environment():
-        st.stop()
+    # Re-check the environment only until the first success; the variables
+    # cannot disappear mid-session.
+    if not st.session_state.get("_env_ok"):
+        if not check_environment():
+            st.stop()
+        st.session_state._env_ok = True
 
     initialize_session_state()
-    render_sidebar()
-    render_chat_interface()
-    render_completion_summary()
+    # One state snapshot shared by every render function this cycle
+    state_info = st.session_state.conversation_manager.get_conversation_state()
+    render_sidebar(state_info)
+    render_chat_interface(state_info)
+    render_completion_summary(state_info)
     logger.info("Application render cycle complete.")
 
 
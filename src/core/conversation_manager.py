@@ -25,13 +25,102 @@ Examples
 """
 
 import re
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, fields
 from enum import Enum
+from itertools import islice
 from loguru import logger
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from src.core.model_manager import ModelManager
 from src.core.database_manager import DatabaseManager
 from src.core.data_validator import validate_email, validate_phone, validate_location
 
+# Patterns compiled once at import rather than per call, so hot handlers do
+# not depend on the re module's evictable internal cache.
+# Requires at least two words, so validation and the "full name" check are a
+# single regex match instead of a match plus a split-and-filter pass.
+_NAME_RE = re.compile(
+    r"^[A-Za-z][A-Za-z'’\-]*\s+[A-Za-z][A-Za-z'’\-]+(?:\s+[A-Za-z][A-Za-z'’\-]+)*$"
+)
+_PHONE_STRIP_RE = re.compile(r"[^\d+\-\s\(\)]")
+
+# Cheap syntax gate before validate_email's full (DNS-backed) check; input
+# without the user@domain.tld shape never pays for the network round-trip.
+_EMAIL_SYNTAX_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Deletion table for phone sanitization: drops every ASCII character that is
+# not a digit, '+', '-', whitespace, or parentheses in one C-level pass.
+_PHONE_ALLOWED = "0123456789+-() \t"
+_PHONE_TRANS = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i) not in _PHONE_ALLOWED)
+)
+_TECH_SPLIT_RE = re.compile(r"[,;/\s]|\band\b", re.IGNORECASE)
+
+# Command keywords interned once; frozenset membership is a single hash probe
+# instead of a per-call list scan.
+_EXIT_CMDS = frozenset({"exit", "quit", "stop", "end", "goodbye", "bye", "done"})
+_GREETINGS = frozenset({"hello", "hi", "hey", "start", "begin"})
+
+# Obvious skip phrasings resolved locally; only ambiguous short answers pay
+# for an LLM classification round-trip. Multi-word phrases are unambiguous
+# wherever they appear; the bare words "skip"/"pass" also occur inside real
+# answers ("we pass objects by reference"), so they only count in responses
+# short enough to fail the attempt-length gate.
+_SKIP_PHRASE_RE = re.compile(
+    r"\b(?:do(?:n[’']?t| not) know|no idea|not sure|next question|"
+    r"can(?:[’']?t|not) answer)\b"
+)
+_SKIP_WORD_RE = re.compile(r"\b(?:skip|pass)\b")
+
+# Matches one numbered/bulleted question line in a batch-generated block.
+_QUESTION_LINE_RE = re.compile(r"^\s*(?:\d+[\).:]|[-*])\s*(.+?)\s*$", re.MULTILINE)
+
+# Indicators of technical depth in an answer; matched via set intersection on
+# tokenized words rather than per-indicator substring scans.
+_WORD_RE = re.compile(r"[a-z]+")
+_TECH_INDICATORS = frozenset(
+    {
+        "implement",
+        "architecture",
+        "design",
+        "optimize",
+        "performance",
+        "scale",
+        "database",
+        "api",
+        "framework",
+        "algorithm",
+        "solution",
+        "challenge",
+        "problem",
+        "approach",
+        "method",
+        "strategy",
+    }
+)
+
+
+@dataclass(slots=True)
+class CandidateData:
+    """
+    Candidate profile collected during screening.
+
+    A slotted dataclass keeps attribute access a fixed-offset load instead
+    of a dict hash probe on the hot handler paths, and rules out typo'd
+    field names at write sites.
+    """
+
+    name: str = ""
+    phone_number: str = ""
+    email: str = ""
+    current_location: str = ""
+    experience_years: int = 0
+    desired_positions: str = ""
+    tech_stack: str = ""
+
+
+_CANDIDATE_FIELD_COUNT = len(fields(CandidateData))
+
 
 class ConversationState(Enum):
     """Enumeration of possible conversation states."""
@@ -65,12 +154,12 @@ class ConversationManager:
         Manages database operations for storing candidate data.
     state : ConversationState
         Current state of the conversation flow.
-    candidate_data : dict
+    candidate_data : CandidateData
         Collected candidate information.
     technical_responses : dict
         Candidate's responses to technical questions.
-    conversation_history : list
-        History of conversation turns for context.
+    conversation_history : collections.deque
+        Bounded ring buffer of recent conversation turns for context.
     tech_stack_list : list
         Parsed list of technologies from candidate's tech stack.
     current_tech_index : int
@@ -84,25 +173,77 @@ class ConversationManager:
     def __init__(self) -> None:
         """Initialize the ConversationManager with required components."""
         logger.info("Initializing ConversationManager.")
-        self.model_manager = ModelManager()
-        self.db_manager = DatabaseManager()
-        self.state = ConversationState.INTRODUCTION
-        self.candidate_data: Dict[str, Any] = {
-            "name": "",
-            "phone_number": "",
-            "email": "",
-            "current_location": "",
-            "experience_years": 0,
-            "desired_positions": "",
-            "tech_stack": "",
-        }
+        # Built lazily via the properties below: constructing a manager (and
+        # its API client / DB connection) is deferred until a message path
+        # actually needs it, keeping session start-up cheap.
+        self._model_manager: Optional[ModelManager] = None
+        self._db_manager: Optional[DatabaseManager] = None
+        self._set_state(ConversationState.INTRODUCTION)
+        self.candidate_data = CandidateData()
         self.technical_responses: Dict[str, Any] = {}
-        self.conversation_history: List[Dict[str, str]] = []
+        self._saved: bool = False
+        self._experience_level: str = self._get_experience_level(0)
+        # Running counters maintained at the write sites so UI polling does
+        # not rescan candidate_data / technical_responses on every call.
+        self._completed_fields: int = 0
+        self._tech_response_counts: Dict[str, int] = defaultdict(int)
+        # Bounded ring buffer: only the recent turns ever reach the LLM, so
+        # long sessions neither grow memory nor slow the slicing call sites.
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=64)
         self.tech_stack_list: List[str] = []
+        # Display string derived once when the tech stack is parsed; reused
+        # by every message that names the full stack.
+        self._tech_stack_display: str = ""
+        # Question total fixed once the stack is parsed (5 per technology);
+        # progress polling divides by the cache instead of recomputing it.
+        self._total_tech_questions: int = 0
         self.current_tech_index: int = 0
         self.technical_questions: List[str] = []
         self.current_tech_question_count: int = 0
         self.tech_assessments: Dict[str, Dict[str, Any]] = {}
+        # State-to-handler transition table; dispatch is a single dict lookup
+        # instead of walking an if/elif ladder on every message.
+        self._dispatch = {
+            ConversationState.INTRODUCTION: self._handle_introduction,
+            ConversationState.COLLECTING_NAME: self._handle_name_collection,
+            ConversationState.COLLECTING_PHONE: self._handle_phone_collection,
+            ConversationState.COLLECTING_EMAIL: self._handle_email_collection,
+            ConversationState.COLLECTING_LOCATION: self._handle_location_collection,
+            ConversationState.COLLECTING_EXPERIENCE: self._handle_experience_collection,
+            ConversationState.COLLECTING_POSITIONS: self._handle_positions_collection,
+            ConversationState.COLLECTING_TECH_STACK: self._handle_tech_stack_collection,
+            ConversationState.REVIEWING_INFORMATION: self._handle_information_review,
+            ConversationState.TECHNICAL_SCREENING: self._handle_technical_screening,
+            ConversationState.COMPLETED: self._handle_post_screening,
+        }
+
+    @property
+    def model_manager(self) -> ModelManager:
+        """Lazily constructed ModelManager shared across the session."""
+        if self._model_manager is None:
+            self._model_manager = ModelManager()
+        return self._model_manager
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """Lazily constructed DatabaseManager shared across the session."""
+        if self._db_manager is None:
+            self._db_manager = DatabaseManager()
+        return self._db_manager
+
+    def _recent_turns(self, k: int) -> List[Dict[str, str]]:
+        """Return the last `k` history turns without copying the whole deque."""
+        history = self.conversation_history
+        return list(islice(history, max(0, len(history) - k), None))
+
+    def _set_state(self, state: ConversationState) -> None:
+        """Set the conversation state and cache its value string.
+
+        Caching `.value` here keeps the log-heavy paths from paying the Enum
+        descriptor lookup on every message.
+        """
+        self.state = state
+        self._state_value = state.value
 
     def handle_message(self, user_input: str) -> str:
         """
@@ -118,47 +259,23 @@ class ConversationManager:
         str
             The chatbot's response message.
         """
-        logger.info(f"Handling message in state: {self.state.value}")
-        logger.debug(f"User input: {user_input}")
+        logger.info(f"Handling message in state: {self._state_value}")
+        logger.debug("User input: {}", user_input)
+        # Strip and lowercase once per message; every handler receives both
+        # forms instead of re-deriving them.
         user_input = user_input.strip()
+        lowered = user_input.lower()
 
         # Handle exit commands - save data and end conversation
-        if user_input.lower() in [
-            "exit",
-            "quit",
-            "stop",
-            "end",
-            "goodbye",
-            "bye",
-            "done",
-        ]:
+        if lowered in _EXIT_CMDS:
             return self._handle_exit()
 
         response = ""
 
         try:
-            if self.state == ConversationState.INTRODUCTION:
-                response = self._handle_introduction(user_input)
-            elif self.state == ConversationState.COLLECTING_NAME:
-                response = self._handle_name_collection(user_input)
-            elif self.state == ConversationState.COLLECTING_PHONE:
-                response = self._handle_phone_collection(user_input)
-            elif self.state == ConversationState.COLLECTING_EMAIL:
-                response = self._handle_email_collection(user_input)
-            elif self.state == ConversationState.COLLECTING_LOCATION:
-                response = self._handle_location_collection(user_input)
-            elif self.state == ConversationState.COLLECTING_EXPERIENCE:
-                response = self._handle_experience_collection(user_input)
-            elif self.state == ConversationState.COLLECTING_POSITIONS:
-                response = self._handle_positions_collection(user_input)
-            elif self.state == ConversationState.COLLECTING_TECH_STACK:
-                response = self._handle_tech_stack_collection(user_input)
-            elif self.state == ConversationState.REVIEWING_INFORMATION:
-                response = self._handle_information_review(user_input)
-            elif self.state == ConversationState.TECHNICAL_SCREENING:
-                response = self._handle_technical_screening(user_input)
-            elif self.state == ConversationState.COMPLETED:
-                response = self._handle_post_screening(user_input)
+            handler = self._dispatch.get(self.state)
+            if handler is not None:
+                response = handler(user_input, lowered)
             else:
                 logger.error(f"Unhandled conversation state: {self.state}")
                 response = (
@@ -167,34 +284,44 @@ class ConversationManager:
                 )
 
         except Exception as e:
-            logger.exception(f"Error handling message in state {self.state.value}: {e}")
+            logger.exception(f"Error handling message in state {self._state_value}: {e}")
             response = (
                 "I apologize, but I encountered an error. "
                 "Please contact support if you are not able to continue with the next question."
             )
 
-        # Add to conversation history
-        self.conversation_history.append({"role": "user", "content": user_input})
-        self.conversation_history.append(
-            {"role": "assistant", "content": response if response is not None else ""}
-        )
-        logger.debug(f"Assistant response: {response}")
+        # Add to conversation history; skip turns with no actual reply so the
+        # LLM context is not padded with empty assistant messages.
+        if response:
+            self.conversation_history.append({"role": "user", "content": user_input})
+            self.conversation_history.append({"role": "assistant", "content": response})
+        logger.debug("Assistant response: {}", response)
 
         return response if response is not None else ""
 
     def _handle_exit(self) -> str:
         """Handle exit command by saving data if possible."""
         logger.info("Exit command received. Attempting to save data.")
-        self.state = ConversationState.EXIT
+        self._set_state(ConversationState.EXIT)
+        # The completed screening already wrote this candidate; don't issue a
+        # second transaction for the goodbye.
+        if self._saved:
+            logger.info("Candidate data already saved; skipping duplicate save.")
+            return (
+                f"Thank you for your time {self.candidate_data.name}! Your information has been saved securely. "
+                "Our team will review your responses and get back to you soon. "
+                "Have a great day!"
+            )
         try:
             # Only save if we have at least basic information
-            if self.candidate_data.get("name") and any(self.candidate_data.values()):
+            if self.candidate_data.name:
                 self.db_manager.save_candidate(
-                    self.candidate_data, self.technical_responses
+                    asdict(self.candidate_data), self.technical_responses
                 )
+                self._saved = True
                 logger.info("Candidate data saved successfully on exit.")
                 return (
-                    f"Thank you for your time {self.candidate_data['name']}! Your information has been saved securely. "
+                    f"Thank you for your time {self.candidate_data.name}! Your information has been saved securely. "
                     "Our team will review your responses and get back to you soon. "
                     "Have a great day!"
                 )
@@ -212,72 +339,78 @@ class ConversationManager:
                 "but our team has been notified. Have a great day!"
             )
 
-    def _handle_introduction(self, user_input: str) -> Optional[str]:
+    def _handle_introduction(self, user_input: str, lowered: str) -> Optional[str]:
         """Handle the introduction phase."""
-        if user_input.lower() == "start":
+        if lowered in _GREETINGS:
             logger.info("Transitioning state from INTRODUCTION to COLLECTING_NAME")
-            self.state = ConversationState.COLLECTING_NAME
+            self._set_state(ConversationState.COLLECTING_NAME)
             return (
                 "Hello and welcome to TalentScout! I'm here to run a short initial screening to collect a few details and "
                 "ask some technical questions tailored to your skills. This should take about 10-15 minutes. To start, "
                 "what's your full name?"
             )
 
-    def _handle_name_collection(self, user_input: str) -> str:
+    def _handle_name_collection(self, user_input: str, lowered: str) -> str:
         """Handle name collection phase."""
-        if not re.match(r"^[a-zA-Z][a-zA-Z\s'’-]+$", user_input):
+        if not _NAME_RE.match(user_input):
             logger.warning(f"Invalid name format received: {user_input}")
-            return "Please provide a valid full name using letters only. Such as 'John Doe'."
-
-        name_parts = [part for part in user_input.split() if len(part) > 1]
-        if len(name_parts) < 1:
-            logger.warning(f"Incomplete name received: {user_input}")
-            return "Please provide your full name (first and last name). For example, 'Mike Smith'."
+            return "Please provide a valid full name (first and last name) using letters only. Such as 'John Doe'."
 
-        self.candidate_data["name"] = user_input.title()
-        logger.info(f"Collected name: {self.candidate_data['name']}")
-        self.state = ConversationState.COLLECTING_PHONE
+        self.candidate_data.name = user_input.title()
+        self._completed_fields += 1
+        logger.info(f"Collected name: {self.candidate_data.name}")
+        self._set_state(ConversationState.COLLECTING_PHONE)
         logger.info("Transitioning state to COLLECTING_PHONE")
-        return f"Nice to meet you, {self.candidate_data['name']}! Please provide your phone number including the country code."
+        return f"Nice to meet you, {self.candidate_data.name}! Please provide your phone number including the country code."
 
-    def _handle_phone_collection(self, user_input: str) -> str:
+    def _handle_phone_collection(self, user_input: str, lowered: str) -> str:
         """Handle phone number collection phase."""
-        phone = re.sub(r"[^\d+\-\s\(\)]", "", user_input)
+        phone = user_input.translate(_PHONE_TRANS)
+        if not phone.isascii():
+            # Rare non-ASCII input still goes through the regex strip
+            phone = _PHONE_STRIP_RE.sub("", phone)
 
         if validate_phone(phone):
-            self.candidate_data["phone_number"] = phone
+            self.candidate_data.phone_number = phone
+            self._completed_fields += 1
             logger.info(f"Collected phone number: {phone}")
-            self.state = ConversationState.COLLECTING_EMAIL
+            self._set_state(ConversationState.COLLECTING_EMAIL)
             logger.info("Transitioning state to COLLECTING_EMAIL")
             return "Great! Provide your deliverable email address for job-related communications."
         else:
             logger.warning(f"Invalid phone number received: {user_input}")
             return "Validation failed! Please provide a valid phone number with country code. e.g., +91 1122334455"
 
-    def _handle_email_collection(self, user_input: str) -> str:
+    def _handle_email_collection(self, user_input: str, lowered: str) -> str:
         """Handle email collection phase."""
-        email = user_input.lower()
+        email = lowered
+
+        if not _EMAIL_SYNTAX_RE.match(email):
+            logger.warning(f"Email failed syntax prefilter: {user_input}")
+            return "Invalid! Please provide a valid email address (e.g., john.doe@mail.com)."
 
         if validate_email(email):
-            self.candidate_data["email"] = email
+            self.candidate_data.email = email
+            self._completed_fields += 1
             logger.info(f"Collected email: {email}")
-            self.state = ConversationState.COLLECTING_LOCATION
+            self._set_state(ConversationState.COLLECTING_LOCATION)
             logger.info("Transitioning state to COLLECTING_LOCATION")
             return "Perfect! Next, what's your current location? (City, Country)"
         else:
             logger.warning(f"Invalid email received: {user_input}")
             return "Invalid! Please provide a valid email address (e.g., john.doe@mail.com)."
 
-    def _handle_location_collection(self, user_input: str) -> str:
+    def _handle_location_collection(self, user_input: str, lowered: str) -> str:
         """Handle location collection phase."""
         if len(user_input) < 2:
             logger.warning(f"Invalid location received (too short): {user_input}")
             return "Please provide your current location e.g., New York, USA."
 
         if validate_location(user_input):
-            self.candidate_data["current_location"] = user_input
+            self.candidate_data.current_location = user_input
+            self._completed_fields += 1
             logger.info(f"Collected and validated location: {user_input}")
-            self.state = ConversationState.COLLECTING_EXPERIENCE
+            self._set_state(ConversationState.COLLECTING_EXPERIENCE)
             logger.info("Transitioning state to COLLECTING_EXPERIENCE")
             return "Location verified! How many years of professional experience do you have?"
         else:
@@ -287,14 +420,20 @@ class ConversationManager:
                 "e.g., 'New Delhi, India'."
             )
 
-    def _handle_experience_collection(self, user_input: str) -> str:
+    def _handle_experience_collection(self, user_input: str, lowered: str) -> str:
         """Handle experience collection phase."""
         try:
             experience = int(user_input)
             if 0 <= experience <= 30:
-                self.candidate_data["experience_years"] = experience
+                self.candidate_data.experience_years = experience
+                if experience:
+                    # Zero years stays "incomplete", matching the old
+                    # truthiness-based scan
+                    self._completed_fields += 1
+                # Derived once here; every question generation reads the cache
+                self._experience_level = self._get_experience_level(experience)
                 logger.info(f"Collected experience: {experience} years")
-                self.state = ConversationState.COLLECTING_POSITIONS
+                self._set_state(ConversationState.COLLECTING_POSITIONS)
                 logger.info("Transitioning state to COLLECTING_POSITIONS")
                 return (
                     "Excellent! What type of positions are you interested in? "
@@ -307,22 +446,23 @@ class ConversationManager:
             logger.warning(f"Invalid input for experience (not a number): {user_input}")
             return "Please provide a valid number for years of experience."
 
-    def _handle_positions_collection(self, user_input: str) -> str:
+    def _handle_positions_collection(self, user_input: str, lowered: str) -> str:
         """Handle desired positions collection phase."""
         if len(user_input) < 3:
             logger.warning(f"Desired positions input too short: {user_input}")
             return "Please describe the type of positions you're interested in."
 
-        self.candidate_data["desired_positions"] = user_input
+        self.candidate_data.desired_positions = user_input
+        self._completed_fields += 1
         logger.info(f"Collected desired positions: {user_input}")
-        self.state = ConversationState.COLLECTING_TECH_STACK
+        self._set_state(ConversationState.COLLECTING_TECH_STACK)
         logger.info("Transitioning state to COLLECTING_TECH_STACK")
         return (
             "Great! Please list the programming languages, frameworks, databases, and tools you are proficient in. "
             "(e.g., Python, JavaScript, React, Node.js, PostgreSQL, etc.)"
         )
 
-    def _handle_tech_stack_collection(self, user_input: str) -> str:
+    def _handle_tech_stack_collection(self, user_input: str, lowered: str) -> str:
         """Handle tech stack collection phase."""
         if len(user_input) < 3:
             logger.warning(f"Tech stack input too short: {user_input}")
@@ -330,20 +470,21 @@ class ConversationManager:
                 "Please describe your technical skills and technologies you work with. At least 2-3 skills."
             )
 
-        self.candidate_data["tech_stack"] = user_input
+        self.candidate_data.tech_stack = user_input
+        self._completed_fields += 1
         logger.info(f"Collected tech stack: {user_input}")
 
-        self.state = ConversationState.REVIEWING_INFORMATION
+        self._set_state(ConversationState.REVIEWING_INFORMATION)
         logger.info("Transitioning state to REVIEWING_INFORMATION")
         return (f"""\
             Let's review the information you've provided so far:\n\n
-            **Name**: {self.candidate_data.get('name')}\n
-            **Phone**: {self.candidate_data.get('phone_number')}\n
-            **Email**: {self.candidate_data.get('email')}\n
-            **Location**: {self.candidate_data.get('current_location')}\n
-            **Experience**: {self.candidate_data.get('experience_years')} years\n
-            **Desired Positions**: {self.candidate_data.get('desired_positions')}\n
-            **Tech Stack**: {self.candidate_data.get('tech_stack')}\n\n
+            **Name**: {self.candidate_data.name}\n
+            **Phone**: {self.candidate_data.phone_number}\n
+            **Email**: {self.candidate_data.email}\n
+            **Location**: {self.candidate_data.current_location}\n
+            **Experience**: {self.candidate_data.experience_years} years\n
+            **Desired Positions**: {self.candidate_data.desired_positions}\n
+            **Tech Stack**: {self.candidate_data.tech_stack}\n\n
             Is everything correct? If not, directly specify what needs to be changed in the following format:\n
             `<field_name>: <new_value>`\n
             For example: `Email: new_email@example.com, Tech Stack: [Python, SQL, ML]`\n
@@ -381,13 +522,15 @@ class ConversationManager:
             parts.append("".join(buf).strip())
         return parts
 
-    def _handle_information_review(self, user_input: str) -> str:
+    def _handle_information_review(self, user_input: str, lowered: str) -> str:
         """Handle information review phase."""
-        if user_input.lower() == "yes":
+        if lowered == "yes":
             logger.info("User confirmed the information.")
 
             # Parse tech stack and initialize technical screening
-            self.tech_stack_list = self._parse_tech_stack(self.candidate_data["tech_stack"])
+            self.tech_stack_list = self._parse_tech_stack(self.candidate_data.tech_stack)
+            self._tech_stack_display = ", ".join(self.tech_stack_list)
+            self._total_tech_questions = len(self.tech_stack_list) * 5
             logger.info(f"Parsed tech stack: {self.tech_stack_list}")
 
             if not self.tech_stack_list:
@@ -404,16 +547,17 @@ class ConversationManager:
                     "current_question": 0,
                 }
 
-            self.state = ConversationState.TECHNICAL_SCREENING
+            self._set_state(ConversationState.TECHNICAL_SCREENING)
             self.current_tech_index = 0
             self.current_tech_question_count = 0
             logger.info("Transitioning state to TECHNICAL_SCREENING")
 
             current_tech = self.tech_stack_list[0]
+            self._pregenerate_questions(current_tech)
             question = self._generate_technical_question(current_tech, 1)
 
             return (
-                f"Perfect! I can see you work with {', '.join(self.tech_stack_list)}. "
+                f"Perfect! I can see you work with {self._tech_stack_display}. "
                 f"Now let's dive into some technical questions to better understand your expertise.\n\n"
                 f"Let's start with **{current_tech}**:\n\n Question {self.current_tech_question_count + 1}: {question}"
             )
@@ -431,22 +575,22 @@ class ConversationManager:
                 field, value = field.strip().lower(), value.strip()
 
                 if field == "name":
-                    self.candidate_data["name"] = value.title()
+                    self.candidate_data.name = value.title()
                 elif field in ["phone", "phone number"]:
                     if validate_phone(value):
-                        self.candidate_data["phone_number"] = value
+                        self.candidate_data.phone_number = value
                     else:
                         logger.warning(f"Invalid phone number format: {value}")
                         return "Invalid phone number format, please provide a valid phone number."
                 elif field in ["email", "email address"]:
                     if validate_email(value):
-                        self.candidate_data["email"] = value
+                        self.candidate_data.email = value
                     else:
                         logger.warning(f"Invalid email format: {value}")
                         return "Invalid email format, please provide a valid email address."
                 elif field in ["location", "current location"]:
                     if validate_location(value):
-                        self.candidate_data["current_location"] = value
+                        self.candidate_data.current_location = value
                     else:
                         logger.warning(f"Invalid location format: {value}")
                         return "Invalid location format, please provide a valid location."
@@ -454,28 +598,29 @@ class ConversationManager:
                     try:
                         years = int(value)
                         if 0 <= years <= 30:
-                            self.candidate_data["experience_years"] = years
+                            self.candidate_data.experience_years = years
+                            self._experience_level = self._get_experience_level(years)
                     except ValueError:
                         logger.warning(f"Invalid experience years format: {value}")
                         return "Invalid experience years format, please provide a valid number of years."
                 elif field in ["positions", "position", "desired positions", "desired position"]:
                     cleaned = value.strip("[] ")
-                    self.candidate_data["desired_positions"] = cleaned
+                    self.candidate_data.desired_positions = cleaned
                 elif field in ["tech stack", "skills"]:
                     cleaned = value.strip("[] ")
-                    self.candidate_data["tech_stack"] = cleaned
+                    self.candidate_data.tech_stack = cleaned
 
             logger.info(f"Candidate data updated: {self.candidate_data}")
 
             return (f"""\
             Got it! Here's the updated information:\n\n
-            **Name**: {self.candidate_data.get('name')}\n
-            **Phone**: {self.candidate_data.get('phone_number')}\n
-            **Email**: {self.candidate_data.get('email')}\n
-            **Location**: {self.candidate_data.get('current_location')}\n
-            **Experience**: {self.candidate_data.get('experience_years')} years\n
-            **Desired Positions**: {self.candidate_data.get('desired_positions')}\n
-            **Tech Stack**: {self.candidate_data.get('tech_stack')}\n\n
+            **Name**: {self.candidate_data.name}\n
+            **Phone**: {self.candidate_data.phone_number}\n
+            **Email**: {self.candidate_data.email}\n
+            **Location**: {self.candidate_data.current_location}\n
+            **Experience**: {self.candidate_data.experience_years} years\n
+            **Desired Positions**: {self.candidate_data.desired_positions}\n
+            **Tech Stack**: {self.candidate_data.tech_stack}\n\n
             If everything looks correct now, please reply with 'yes' to proceed.
             """
         )
@@ -491,10 +636,11 @@ class ConversationManager:
         """
         Parse tech stack string into normalized list of technologies.
         """
-        raw_tokens = re.split(r"[,;/\s]|\band\b", tech_stack, flags=re.IGNORECASE)
+        raw_tokens = _TECH_SPLIT_RE.split(tech_stack)
         technologies = []
         for token in raw_tokens:
-            tech = token.strip(" .;:- ").strip()
+            # One strip pass per token; the char set already covers whitespace.
+            tech = token.strip(" .;:-")
             if not tech:
                 continue
 
@@ -507,18 +653,58 @@ class ConversationManager:
                 normalized = tech.capitalize()
             technologies.append(normalized)
 
-        seen = set()
-        return [t for t in technologies if not (t in seen or seen.add(t))]
+        # dict.fromkeys dedupes in one C-level pass while keeping input order
+        return list(dict.fromkeys(technologies))
+
+    def _pregenerate_questions(self, technology: str) -> None:
+        """
+        Pre-generate the five questions for a technology in one LLM call.
+
+        One batched prompt replaces five round-trips, so the per-question
+        latency the candidate sees drops to a list lookup. Failures are
+        tolerated: `_generate_technical_question` falls back to live
+        generation for any question missing from the cache.
+        """
+        experience_years = self.candidate_data.experience_years
+        experience_level = self._experience_level
+        logger.info(f"Pre-generating question set for {technology}.")
+
+        batch_prompt = f"""Generate exactly 5 progressively harder technical questions about {technology} for someone with {experience_years} years of experience.
+
+Question guidelines:
+- Ask to explain a specific concept, definition or process instead of asking to write code
+- Difficulty should match {experience_level} level ({experience_years} years experience) and increase from question 1 to question 5
+- Focus on theoretical knowledge, to check the understanding of key principles
+- For experienced candidates, include real-world scenarios or problem-solving elements
+- Keep each question concise but specific
+- Each should be answerable in 2-4 sentences
+
+Return only the 5 questions as a numbered list (1. to 5.), one per line, no additional text."""
+
+        try:
+            raw = self.model_manager.generate_response(batch_prompt, [])
+            questions = [q for q in _QUESTION_LINE_RE.findall(raw) if q]
+            self.tech_assessments[technology]["questions"] = questions[:5]
+            logger.info(f"Cached {len(questions[:5])} questions for {technology}.")
+        except Exception as e:
+            logger.exception(f"Error pre-generating questions for {technology}: {e}")
 
     def _generate_technical_question(
         self, technology: str, question_number: int
     ) -> str:
         """
         Generate a technical question for a specific technology.
+
+        Serves from the pre-generated question cache when available and only
+        falls back to a live LLM call when the cache is missing or short.
         """
-        experience_years = self.candidate_data.get("experience_years", 0)
-        experience_level = self._get_experience_level(experience_years)
-        desired_position = self.candidate_data.get("desired_position", "")
+        cached = self.tech_assessments.get(technology, {}).get("questions", [])
+        if len(cached) >= question_number:
+            return cached[question_number - 1]
+
+        experience_years = self.candidate_data.experience_years
+        experience_level = self._experience_level
+        desired_position = self.candidate_data.desired_positions
         logger.info(
             f"Generating Q{question_number} for {technology} at {experience_level} level."
         )
@@ -543,8 +729,11 @@ Question guidelines:
 Generate only the question, no additional text, analysis or explanations."""
 
         try:
+            # The prompt already carries the candidate's recent responses;
+            # only the last few turns of history add useful context.
             question = self.model_manager.generate_response(
-                context_prompt, self.conversation_history
+                context_prompt,
+                self._recent_turns(6),
             )
             logger.info(f"Generated question: {question}")
             return question.strip()
@@ -552,7 +741,7 @@ Generate only the question, no additional text, analysis or explanations."""
             logger.exception(f"Error generating question for {technology}: {e}")
             return "Unable to generate question, please try contacting support."
 
-    def _handle_technical_screening(self, user_input: str) -> str:
+    def _handle_technical_screening(self, user_input: str, lowered: str) -> str:
         """Handle technical screening questions with follow-up logic."""
         if not self.tech_stack_list:
             logger.error("Technical screening attempted with an empty tech stack list.")
@@ -564,6 +753,7 @@ Generate only the question, no additional text, analysis or explanations."""
         tech_assessment["responses"].append(user_input)
         response_key = f"{current_tech}_q{self.current_tech_question_count + 1}"
         self.technical_responses[response_key] = user_input
+        self._tech_response_counts[current_tech] += 1
         logger.info(f"Stored response for {response_key}")
 
         self.current_tech_question_count += 1
@@ -596,6 +786,7 @@ Generate only the question, no additional text, analysis or explanations."""
             if self.current_tech_index < len(self.tech_stack_list):
                 next_tech = self.tech_stack_list[self.current_tech_index]
                 logger.info(f"Moving to next technology: {next_tech}")
+                self._pregenerate_questions(next_tech)
                 question = self._generate_technical_question(next_tech, 1)
                 return f"Excellent work on {current_tech}! Now let's move to **{next_tech}**:\n\n Question {self.current_tech_question_count + 1}: {question}"
             else:
@@ -605,7 +796,20 @@ Generate only the question, no additional text, analysis or explanations."""
     def _is_skip_response(self, user_input: str) -> bool:
         """
         Use AI to decide whether the response means 'skip / unable to answer'.
+
+        Clear-cut cases are resolved locally first: an unambiguous skip
+        phrase is a skip, any other substantive-length answer is an attempt,
+        and a short "skip"/"pass" is a skip. Only short, ambiguous responses
+        fall through to the LLM.
         """
+        lowered = user_input.lower()
+        if _SKIP_PHRASE_RE.search(lowered):
+            return True
+        if len(lowered.split()) >= 5:
+            return False
+        if _SKIP_WORD_RE.search(lowered):
+            return True
+
         prompt = f"""
         Determine if the following candidate response indicates that they are skipping,
         unable to answer, or do not know the answer.
@@ -627,33 +831,13 @@ Generate only the question, no additional text, analysis or explanations."""
         """
         Assess if a response warrants a follow-up question.
         """
-        response_lower = response.lower()
         if len(response.split()) < 10:
             logger.info("Response is too short for a follow-up.")
             return False
 
-        technical_indicators = [
-            "implement",
-            "architecture",
-            "design",
-            "optimize",
-            "performance",
-            "scale",
-            "database",
-            "api",
-            "framework",
-            "algorithm",
-            "solution",
-            "challenge",
-            "problem",
-            "approach",
-            "method",
-            "strategy",
-        ]
-        indicator_count = sum(
-            1 for indicator in technical_indicators if indicator in response_lower
-        )
-        logger.debug(f"Found {indicator_count} technical indicators in response.")
+        tokens = set(_WORD_RE.findall(response.lower()))
+        indicator_count = len(tokens & _TECH_INDICATORS)
+        logger.debug("Found {} technical indicators in response.", indicator_count)
         return indicator_count >= 2
 
     def _generate_followup_question(
@@ -677,7 +861,8 @@ Generate only the follow-up question, no additional text."""
 
         try:
             followup = self.model_manager.generate_response(
-                context_prompt, self.conversation_history[-4:]
+                context_prompt,
+                self._recent_turns(4),
             )
             logger.info(f"Generated follow-up: {followup}")
             return followup.strip()
@@ -693,14 +878,15 @@ Generate only the follow-up question, no additional text."""
                 **self.technical_responses,
                 "tech_assessments": self.tech_assessments,
             }
-            self.db_manager.save_candidate(self.candidate_data, all_responses)
-            self.state = ConversationState.COMPLETED
+            self.db_manager.save_candidate(asdict(self.candidate_data), all_responses)
+            self._saved = True
+            self._set_state(ConversationState.COMPLETED)
             logger.info("Transitioning state to COMPLETED.")
 
-            name = self.candidate_data.get("name", "")
+            name = self.candidate_data.name
             return (
                 f"Outstanding work, {name}! You've completed the comprehensive technical screening "
-                f"covering {', '.join(self.tech_stack_list)}.\n\n"
+                f"covering {self._tech_stack_display}.\n\n"
                 f"Your responses have been saved securely and show strong technical knowledge across "
                 f"multiple technologies. Our technical team will review your detailed responses and "
                 f"get back to you within 2-3 business days.\n\n"
@@ -714,18 +900,18 @@ Generate only the follow-up question, no additional text."""
                 "a technical issue saving your data. Please contact our HR team directly with your information."
             )
 
-    def _handle_post_screening(self, user_input: str) -> str:
+    def _handle_post_screening(self, user_input: str, lowered: str) -> str:
         """Handle messages after screening is completed."""
 
         logger.info(f"Handling post-completion message: {user_input}")
         context_prompt = (
-            f"The candidate {self.candidate_data.get('name', '')} has completed their screening. "
+            f"The candidate {self.candidate_data.name} has completed their screening. "
             f"They are asking: '{user_input}'. Tell them to contact our HR team for more information."
         )
 
         response = self.model_manager.generate_response(
             context_prompt,
-            self.conversation_history[-6:] if self.conversation_history else [],
+            self._recent_turns(6),
         )
         return (response)
 
@@ -734,8 +920,8 @@ Generate only the follow-up question, no additional text."""
         Get current conversation state information.
         """
         return {
-            "state": self.state.value,
-            "candidate_data": self.candidate_data,
+            "state": self._state_value,
+            "candidate_data": asdict(self.candidate_data),
             "technical_responses": self.technical_responses,
             "completion_percentage": self._calculate_completion_percentage(),
         }
@@ -746,23 +932,16 @@ Generate only the follow-up question, no additional text."""
             return 100
         elif self.state == ConversationState.TECHNICAL_SCREENING:
             base_percentage = 60
-            if self.tech_stack_list:
-                total_questions = len(self.tech_stack_list) * 5
+            if self._total_tech_questions:
                 answered_questions = len(self.technical_responses)
                 tech_percentage = (
-                    (answered_questions / total_questions) * 40
-                    if total_questions > 0
-                    else 0
-                )
+                    answered_questions / self._total_tech_questions
+                ) * 40
                 return int(base_percentage + tech_percentage)
             else:
                 return base_percentage
         else:
-            total_fields = len(self.candidate_data)
-            completed_fields = sum(1 for value in self.candidate_data.values() if value)
-            return (
-                int((completed_fields / total_fields) * 60) if total_fields > 0 else 0
-            )
+            return int((self._completed_fields / _CANDIDATE_FIELD_COUNT) * 60)
 
     def _get_experience_level(self, years: int) -> str:
         """Determine experience level based on years."""
@@ -784,14 +963,12 @@ Generate only the follow-up question, no additional text."""
 
         progress = {}
         for i, tech in enumerate(self.tech_stack_list):
-            tech_responses = [
-                k for k in self.technical_responses.keys() if k.startswith(tech)
-            ]
+            completed = self._tech_response_counts[tech]
             progress[tech] = {
-                "completed": len(tech_responses),
+                "completed": completed,
                 "total": 5,
                 "is_current": i == self.current_tech_index,
-                "is_completed": len(tech_responses) >= 5,
+                "is_completed": completed >= 5,
             }
 
         current_tech = (
@@ -31,10 +31,130 @@ True
 True
 """
 
+import re
+import time
+import asyncio
+import sqlite3
 import requests
-import phonenumbers
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
-from email_validator import EmailNotValidError, validate_email as ev_validate
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# phonenumbers (tens of MB of region metadata) and email_validator are
+# imported on first use rather than at module import, keeping Streamlit
+# cold-start time and memory down when a path is never exercised.
+phonenumbers = None
+ev_validate = None
+EmailNotValidError = None
+
+
+def _load_phonenumbers() -> None:
+    """Import `phonenumbers` on first use and cache it at module level."""
+    global phonenumbers
+    if phonenumbers is None:
+        import phonenumbers as _phonenumbers
+
+        phonenumbers = _phonenumbers
+
+
+def _load_email_validator() -> None:
+    """Import `email_validator` on first use and cache it at module level."""
+    global ev_validate, EmailNotValidError
+    if ev_validate is None:
+        from email_validator import (
+            EmailNotValidError as _EmailNotValidError,
+            validate_email as _ev_validate,
+        )
+
+        ev_validate = _ev_validate
+        EmailNotValidError = _EmailNotValidError
+
+# One session for all Nominatim calls: keep-alive reuses the TLS socket, so
+# validations after the first skip the TCP+TLS handshake entirely.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "hiring-assistant-chatbot"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        # Retry transient server/rate-limit statuses inside the adapter with
+        # backoff, so a flaky 503 does not surface as a false negative.
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# Two-level cache for Nominatim lookups: an in-memory LRU answers repeats in
+# the current process without a network round-trip, and a small SQLite table
+# persists results across restarts. Keys are normalized location strings.
+_CACHE_DB = "candidates.db"
+_CACHE_TTL = 30 * 24 * 3600  # seconds; stale entries are purged at startup
+_CACHE_MAX = 1024
+_IMPORTANCE_THRESHOLD = 0.2
+_location_cache: "OrderedDict[str, bool]" = OrderedDict()
+
+
+def _location_cache_connect() -> sqlite3.Connection:
+    """Open the cache database, creating the cache table if needed."""
+    conn = sqlite3.connect(_CACHE_DB)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS location_cache (
+            key TEXT PRIMARY KEY,
+            display_name TEXT,
+            importance REAL,
+            ts INTEGER
+        )
+        """
+    )
+    return conn
+
+
+def _preload_location_cache() -> None:
+    """Warm the in-memory LRU from the on-disk table, evicting expired rows."""
+    try:
+        with _location_cache_connect() as conn:
+            cutoff = int(time.time()) - _CACHE_TTL
+            conn.execute("DELETE FROM location_cache WHERE ts < ?", (cutoff,))
+            rows = conn.execute(
+                "SELECT key, importance FROM location_cache "
+                "ORDER BY ts DESC LIMIT ?",
+                (_CACHE_MAX,),
+            ).fetchall()
+        for key, importance in reversed(rows):
+            _location_cache[key] = importance >= _IMPORTANCE_THRESHOLD
+    except sqlite3.Error as e:
+        logger.warning(f"Could not preload location cache: {e}")
+
+
+def _store_location_result(key: str, display_name: str, importance: float) -> None:
+    """Record a Nominatim result in both cache layers."""
+    _location_cache[key] = importance >= _IMPORTANCE_THRESHOLD
+    _location_cache.move_to_end(key)
+    while len(_location_cache) > _CACHE_MAX:
+        _location_cache.popitem(last=False)
+    try:
+        with _location_cache_connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO location_cache "
+                "(key, display_name, importance, ts) VALUES (?, ?, ?, ?)",
+                (key, display_name, importance, int(time.time())),
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Could not persist location cache entry: {e}")
+
+
+_preload_location_cache()
+
+# Cheap shape check before phonenumbers.parse, which walks region metadata
+# even for obviously malformed strings.
+_PHONE_RE = re.compile(r"^\+?[0-9\s().\-]{6,20}$")
 
 
 def validate_email(email: str) -> bool:
@@ -44,6 +164,7 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
     logger.info(f"Validating email: {email}")
+    _load_email_validator()
     try:
         ev_validate(email)
         logger.info(f"Email validation successful for {email}")
@@ -58,6 +179,10 @@ def validate_phone(phone: str) -> bool:
     Validate an international phone number.
     """
     logger.info(f"Validating phone number: {phone}")
+    if not phone or not _PHONE_RE.match(phone):
+        logger.warning(f"Phone number failed shape prefilter: {phone}")
+        return False
+    _load_phonenumbers()
     try:
         parsed = phonenumbers.parse(phone, None)
         is_valid = phonenumbers.is_valid_number(parsed)
@@ -78,15 +203,17 @@ def validate_location(location: str) -> bool:
     Validate a geographic location.
     """
     logger.info(f"Validating location: {location}")
+    key = location.strip().casefold()
+    cached = _location_cache.get(key)
+    if cached is not None:
+        _location_cache.move_to_end(key)
+        logger.info(f"Location '{location}' served from cache: {cached}")
+        return cached
+
     url = "https://nominatim.openstreetmap.org/search"
     params = {"q": location, "format": "json", "limit": 1}
     try:
-        resp = requests.get(
-            url,
-            params=params,
-            headers={"User-Agent": "hiring-assistant-chatbot"},
-            timeout=10,
-        )
+        resp = _SESSION.get(url, params=params, timeout=10)
         if resp.status_code != 200:
             logger.error(
                 f"Nominatim API request failed with status {resp.status_code}: {resp.text}"
@@ -106,7 +233,8 @@ def validate_location(location: str) -> bool:
             return False
 
         importance = float(result.get("importance", 0))
-        if importance < 0.2:
+        _store_location_result(key, result["display_name"], importance)
+        if importance < _IMPORTANCE_THRESHOLD:
             logger.warning(
                 f"Location '{location}' has a low importance score ({importance}), likely not a valid place."
             )
@@ -122,3 +250,87 @@ def validate_location(location: str) -> bool:
             f"An error occurred while validating location '{location}': {e}"
         )
         return False
+
+
+def validate_locations(locations: "list[str]") -> "dict[str, bool]":
+    """
+    Validate a batch of locations, fanning uncached lookups out in parallel.
+
+    Parameters
+    ----------
+    locations : list of str
+        The locations to validate.
+
+    Returns
+    -------
+    dict of str to bool
+        Validation outcome per input location.
+
+    Notes
+    -----
+    Cache hits are answered inline; only misses go to Nominatim, through a
+    pool of 5 workers sharing the pooled session, so N uncached lookups
+    cost roughly ceil(N/5) round-trips instead of N. Results are written
+    back to both cache layers by `validate_location`.
+    """
+    results: "dict[str, bool]" = {}
+    misses: "list[str]" = []
+    for location in locations:
+        key = location.strip().casefold()
+        cached = _location_cache.get(key)
+        if cached is not None:
+            _location_cache.move_to_end(key)
+            results[location] = cached
+        elif location not in misses:
+            misses.append(location)
+
+    if misses:
+        logger.info(f"Fetching {len(misses)} uncached location(s) in parallel.")
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            for location, valid in zip(misses, pool.map(validate_location, misses)):
+                results[location] = valid
+    return results
+
+
+async def _validate_location_async(
+    location: str, sem: asyncio.Semaphore
+) -> bool:
+    """Run one location lookup off the event loop, rate-limited by `sem`."""
+    async with sem:
+        return await asyncio.to_thread(validate_location, location)
+
+
+async def validate_batch(records: "list[dict]") -> "list[dict]":
+    """
+    Validate a batch of candidate records concurrently.
+
+    Parameters
+    ----------
+    records : list of dict
+        Each record may carry "email", "phone", and "location" keys.
+
+    Returns
+    -------
+    list of dict
+        One result dict per record, in input order, mapping each field name
+        to its validation outcome.
+
+    Notes
+    -----
+    The synchronous validators run in worker threads via `asyncio.to_thread`
+    and overlap through the pooled session, so wall-clock time approaches
+    the slowest single lookup rather than the sum. Location lookups share a
+    semaphore capped at 5 in-flight requests to respect Nominatim's usage
+    policy.
+    """
+    sem = asyncio.Semaphore(5)
+
+    async def _validate_one(record: dict) -> dict:
+        email_ok, phone_ok, location_ok = await asyncio.gather(
+            asyncio.to_thread(validate_email, record.get("email", "")),
+            asyncio.to_thread(validate_phone, record.get("phone", "")),
+            _validate_location_async(record.get("location", ""), sem),
+        )
+        return {"email": email_ok, "phone": phone_ok, "location": location_ok}
+
+    return list(await asyncio.gather(*(_validate_one(r) for r in records)))
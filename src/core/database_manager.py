@@ -39,18 +39,45 @@ Examples
 """
 
 import json
+import atexit
+import queue
 import sqlite3
+import threading
+from concurrent.futures import Future
 from loguru import logger
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 from src.core.encryption_handler import EncryptionManager
 
+# Serialize technical responses with orjson (C-level, several times faster
+# on the long answer strings) when it is installed; stdlib json otherwise.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
 
 class DatabaseManager:
     """
     Manager for candidate database operations with encryption for sensitive fields.
     """
 
+    _INSERT_SQL = """
+        INSERT INTO candidates
+        (date_time, name, phone_number, email, current_location, experience_years,
+         desired_positions, tech_stack, technical_responses_json)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+    # Maximum rows coalesced into one transaction by the writer thread.
+    _BATCH_MAX = 32
+
     def __init__(self, db_path: str = "candidates.db") -> None:
         """
         Initialize the DatabaseManager and ensure the candidates table exists.
@@ -58,7 +85,45 @@ class DatabaseManager:
         logger.info(f"Initializing DatabaseManager with db_path: {db_path}")
         self.db_path = db_path
         self.encryption_manager = EncryptionManager()
+        # One connection for the manager's lifetime: saves repay neither the
+        # file-open/schema-parse cost of sqlite3.connect nor the SQL re-parse
+        # (sqlite3's per-connection statement cache keeps the prepared
+        # INSERT alive between calls).
+        self._conn = self._connect()
         self._create_table()
+        # All writes funnel through one background thread that owns the
+        # connection: concurrent sessions no longer contend on SQLite's
+        # write lock, and rows queued close together share one commit.
+        self._queue: "queue.Queue[tuple[tuple, Future]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, daemon=True, name="db-writer"
+        )
+        self._writer.start()
+        atexit.register(self._close)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection with performance PRAGMAs applied.
+
+        `synchronous=NORMAL` halves the fsyncs per commit under WAL, while
+        the in-memory temp store and larger page cache keep working data off
+        disk. `busy_timeout` makes concurrent writers wait instead of failing
+        immediately with "database is locked". The enlarged statement cache
+        keeps the prepared INSERT (and any future statements) resident, so
+        repeat executions skip the SQL re-parse.
+        """
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        conn.executescript(
+            """
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA busy_timeout=5000;
+            """
+        )
+        return conn
 
     def _create_table(self) -> None:
         """
@@ -66,8 +131,11 @@ class DatabaseManager:
         """
         logger.info(f"Ensuring 'candidates' table exists in {self.db_path}")
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
+                # WAL persists in the database file, so it only needs to be
+                # set once here; writers stop blocking readers from then on.
+                cursor.execute("PRAGMA journal_mode=WAL")
                 cursor.execute(
                     """
                     CREATE TABLE IF NOT EXISTS candidates (
@@ -90,51 +158,115 @@ class DatabaseManager:
             logger.exception(f"Error creating table in {self.db_path}: {e}")
             raise
 
-    def save_candidate(
+    def _build_row(
         self, candidate_data: Dict[str, Any], technical_responses: Dict[str, Any]
-    ) -> None:
+    ) -> tuple:
         """
-        Save candidate data to the database, encrypting sensitive fields.
+        Build the INSERT parameter tuple for one candidate, encrypting
+        sensitive fields.
         """
-        candidate_name = candidate_data.get("name", "N/A")
-        logger.info(f"Attempting to save candidate data for: {candidate_name}")
-        try:
-            encrypted_phone = self.encryption_manager.encrypt(
-                candidate_data.get("phone_number", "")
-            )
-            encrypted_email = self.encryption_manager.encrypt(
-                candidate_data.get("email", "")
-            )
-            encrypted_location = self.encryption_manager.encrypt(
-                candidate_data.get("current_location", "")
+        encrypted_phone, encrypted_email, encrypted_location = (
+            self.encryption_manager.encrypt_many(
+                [
+                    candidate_data.get("phone_number", ""),
+                    candidate_data.get("email", ""),
+                    candidate_data.get("current_location", ""),
+                ]
             )
+        )
+        return (
+            datetime.now().isoformat(),
+            candidate_data.get("name", ""),
+            encrypted_phone,
+            encrypted_email,
+            encrypted_location,
+            int(candidate_data.get("experience_years", 0)),
+            candidate_data.get("desired_positions", ""),
+            candidate_data.get("tech_stack", ""),
+            _dumps(technical_responses),
+        )
 
-            data = (
-                datetime.now().isoformat(),
-                candidate_data.get("name", ""),
-                encrypted_phone,
-                encrypted_email,
-                encrypted_location,
-                int(candidate_data.get("experience_years", 0)),
-                candidate_data.get("desired_positions", ""),
-                candidate_data.get("tech_stack", ""),
-                json.dumps(technical_responses),
-            )
+    def save_candidates(
+        self, records: List[tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> None:
+        """
+        Save a batch of candidate records in a single transaction.
 
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO candidates
-                    (date_time, name, phone_number, email, current_location, experience_years,
-                     desired_positions, tech_stack, technical_responses_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    data,
-                )
-                conn.commit()
-                logger.info(f"Successfully saved candidate: {candidate_name}")
+        Parameters
+        ----------
+        records : list of (dict, dict)
+            Pairs of candidate data and technical responses.
+
+        Notes
+        -----
+        All rows go through one `executemany` inside one transaction, so the
+        batch costs a single commit (one fsync) rather than one per row.
+        """
+        logger.info(f"Attempting to save a batch of {len(records)} candidate(s).")
+        try:
+            rows = [
+                self._build_row(candidate_data, technical_responses)
+                for candidate_data, technical_responses in records
+            ]
+
+            # Hand the rows to the writer thread and wait for its commit, so
+            # callers keep synchronous error propagation.
+            futures = [Future() for _ in rows]
+            for row, future in zip(rows, futures):
+                self._queue.put((row, future))
+            for future in futures:
+                future.result()
+            logger.info(f"Successfully saved {len(rows)} candidate(s).")
 
         except Exception as e:
-            logger.exception(f"Error saving candidate {candidate_name}: {e}")
+            logger.exception(f"Error saving candidate batch: {e}")
             raise RuntimeError(f"Error saving candidate: {e}") from e
+
+    def _writer_loop(self) -> None:
+        """
+        Single-writer loop: drain queued rows and commit them in batches.
+
+        Rows that arrive close together (up to `_BATCH_MAX`) share one
+        transaction, coalescing fsyncs; per-row futures report the commit
+        outcome back to the queueing callers.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._BATCH_MAX:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._conn as conn:
+                    conn.cursor().executemany(
+                        self._INSERT_SQL, [row for row, _ in batch]
+                    )
+                    conn.commit()
+            except Exception as e:
+                logger.exception(f"Writer thread failed to commit batch: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for _, future in batch:
+                    future.set_result(None)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _close(self) -> None:
+        """Flush pending writes and close the connection at interpreter exit."""
+        self._queue.join()
+        self._conn.close()
+
+    def save_candidate(
+        self, candidate_data: Dict[str, Any], technical_responses: Dict[str, Any]
+    ) -> None:
+        """
+        Save candidate data to the database, encrypting sensitive fields.
+
+        Thin wrapper over `save_candidates` for the single-record case.
+        """
+        candidate_name = candidate_data.get("name", "N/A")
+        logger.info(f"Attempting to save candidate data for: {candidate_name}")
+        self.save_candidates([(candidate_data, technical_responses)])
@@ -40,19 +40,42 @@ Examples
 """
 
 import os
-from openai import OpenAI
-from typing import List, Dict
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Iterator, List, Dict
 from loguru import logger
 from dotenv import load_dotenv
-from openai.types.chat import (
-    ChatCompletionSystemMessageParam,
-    ChatCompletionUserMessageParam,
-    ChatCompletionAssistantMessageParam,
-)
 
 # Load environment variables
 load_dotenv()
 
+# openai is imported on first ModelManager construction rather than at
+# module import, keeping Streamlit cold-start time and memory down until a
+# model call is actually needed.
+OpenAI = None
+ChatCompletionSystemMessageParam = None
+ChatCompletionUserMessageParam = None
+ChatCompletionAssistantMessageParam = None
+
+
+def _load_openai() -> None:
+    """Import the openai client and message types on first use."""
+    global OpenAI, ChatCompletionSystemMessageParam
+    global ChatCompletionUserMessageParam, ChatCompletionAssistantMessageParam
+    if OpenAI is None:
+        from openai import OpenAI as _OpenAI
+        from openai.types.chat import (
+            ChatCompletionSystemMessageParam as _SystemParam,
+            ChatCompletionUserMessageParam as _UserParam,
+            ChatCompletionAssistantMessageParam as _AssistantParam,
+        )
+
+        OpenAI = _OpenAI
+        ChatCompletionSystemMessageParam = _SystemParam
+        ChatCompletionUserMessageParam = _UserParam
+        ChatCompletionAssistantMessageParam = _AssistantParam
+
 
 class ModelManager:
     """
@@ -64,20 +87,50 @@ class ModelManager:
         OpenRouter client for sending chat completion requests.
     """
 
-    def __init__(self) -> None:
+    _CACHE_MAX = 512
+    # Reasoning markers suppressed while streaming; the holdback keeps a
+    # marker split across chunk boundaries detectable.
+    _STREAM_MARKERS = ("assistantfinal", "analysis")
+    _STREAM_HOLDBACK = max(len(m) for m in _STREAM_MARKERS) - 1
+
+    def __init__(self, client=None) -> None:
         """
         Initialize the ModelManager with an OpenRouter client.
 
+        Parameters
+        ----------
+        client : optional
+            A pre-built client exposing the OpenAI chat-completions API.
+            When omitted, an OpenRouter client is constructed from
+            `OPENROUTER_API_KEY`. Injecting a client avoids the construction
+            cost (and any patching) for callers that already hold one.
+
         Notes
         -----
         This constructor uses the environment variable `OPENROUTER_API_KEY`
-        to authenticate with OpenRouter. Make sure it is set before instantiation.
+        to authenticate with OpenRouter. Make sure it is set before
+        instantiation. It also resolves `OPENROUTER_MODEL` once, raising a
+        ValueError immediately if it is missing rather than on first use.
         """
         logger.info("Initializing ModelManager.")
-        self.client = OpenAI(
+        _load_openai()
+        self.client = client if client is not None else OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=os.getenv("OPENROUTER_API_KEY"),
         )
+        # The system prompt and model name never change for the life of the
+        # manager; build the system message and resolve the model once here
+        # (failing fast on a missing model) instead of per request.
+        self._system_msg = ChatCompletionSystemMessageParam(
+            role="system", content=self.get_system_prompt()
+        )
+        self._model_name = os.getenv("OPENROUTER_MODEL")
+        if not self._model_name:
+            logger.error("OPENROUTER_MODEL environment variable is not set.")
+            raise ValueError("OPENROUTER_MODEL environment variable is not set.")
+        # Bounded LRU keyed by a digest of the full messages list: reloads
+        # and retries with identical context skip the API round-trip.
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
         logger.info("ModelManager initialized successfully.")
 
     def generate_response(
@@ -112,41 +165,22 @@ class ModelManager:
         - Response generation uses `max_tokens=512` and `temperature=0.3`.
         """
         logger.info("Generating model response.")
-        logger.debug(f"User prompt: {user_prompt}")
+        logger.debug("User prompt: {}", user_prompt)
         try:
-            messages: List = [
-                ChatCompletionSystemMessageParam(
-                    role="system", content=self.get_system_prompt()
-                )
-            ]
-
-            if history:
-                for msg in history:
-                    if msg["role"] == "user":
-                        messages.append(
-                            ChatCompletionUserMessageParam(
-                                role="user", content=msg["content"]
-                            )
-                        )
-                    elif msg["role"] == "assistant":
-                        messages.append(
-                            ChatCompletionAssistantMessageParam(
-                                role="assistant", content=msg["content"]
-                            )
-                        )
-
-            messages.append(
-                ChatCompletionUserMessageParam(role="user", content=user_prompt)
-            )
-
-            model_name = os.getenv("OPENROUTER_MODEL")
-            if not model_name:
-                logger.error("OPENROUTER_MODEL environment variable is not set.")
-                raise ValueError("OPENROUTER_MODEL environment variable is not set.")
-
-            logger.info(f"Requesting completion from model: {model_name}")
+            messages = self._build_messages(user_prompt, history)
+
+            key = hashlib.blake2b(
+                json.dumps(messages, sort_keys=True).encode(), digest_size=16
+            ).hexdigest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                logger.info("Serving model response from cache.")
+                return cached
+
+            logger.info(f"Requesting completion from model: {self._model_name}")
             completion = self.client.chat.completions.create(
-                model=model_name,
+                model=self._model_name,
                 messages=messages,
                 max_tokens=512,
                 temperature=0.3,
@@ -154,14 +188,165 @@ class ModelManager:
 
             content = completion.choices[0].message.content
             logger.info("Successfully generated model response.")
-            logger.debug(f"Raw model response: {content}")
-            return self._clean_output(content) if content else "I'm sorry, I couldn’t generate a response."
+            logger.debug("Raw model response: {}", content)
+            if not content:
+                return "I'm sorry, I couldn’t generate a response."
+
+            cleaned = self._clean_output(content)
+            # Only successful responses are cached; error fallbacks should
+            # always retry the API.
+            self._cache[key] = cleaned
+            while len(self._cache) > self._CACHE_MAX:
+                self._cache.popitem(last=False)
+            return cleaned
 
 
         except Exception as e:
             logger.exception(f"Error generating response: {e}")
             return "\n\nSomething went wrong while generating a response through API, please wait and restart the conversation!"
 
+    def _build_messages(
+        self, user_prompt: str, history: List[Dict[str, str]]
+    ) -> List:
+        """Assemble the messages list: system prompt, history, user turn."""
+        messages: List = [self._system_msg]
+        if history:
+            for msg in history:
+                if msg["role"] == "user":
+                    messages.append(
+                        ChatCompletionUserMessageParam(
+                            role="user", content=msg["content"]
+                        )
+                    )
+                elif msg["role"] == "assistant":
+                    messages.append(
+                        ChatCompletionAssistantMessageParam(
+                            role="assistant", content=msg["content"]
+                        )
+                    )
+        messages.append(
+            ChatCompletionUserMessageParam(role="user", content=user_prompt)
+        )
+        return messages
+
+    def generate_response_stream(
+        self, user_prompt: str, history: List[Dict[str, str]] = []
+    ) -> Iterator[str]:
+        """
+        Generate a model response incrementally as tokens arrive.
+
+        Parameters
+        ----------
+        user_prompt : str
+            The latest message from the user.
+        history : list of dict, optional
+            Prior conversation messages, as in `generate_response`.
+
+        Yields
+        ------
+        str
+            Chunks of the response text, in order. Concatenating all chunks
+            gives the cleaned response.
+
+        Notes
+        -----
+        Perceived latency drops to time-to-first-token instead of total
+        generation time. Responses that open with a reasoning marker are
+        withheld until ``assistantfinal`` arrives (or the stream ends), so
+        reasoning text is never emitted; only those responses give up the
+        streaming head start. Ordinary responses stream live, with a short
+        tail held back so a marker split across chunks is still caught. The
+        concatenated chunks match `_clean_output`'s result of keeping only
+        the final message.
+        """
+        logger.info("Generating streaming model response.")
+        logger.debug("User prompt: {}", user_prompt)
+        try:
+            messages = self._build_messages(user_prompt, history)
+            logger.info(f"Requesting streamed completion from model: {self._model_name}")
+            completion = self.client.chat.completions.create(
+                model=self._model_name,
+                messages=messages,
+                max_tokens=512,
+                temperature=0.3,
+                stream=True,
+            )
+
+            buffer = ""
+            emitted = 0
+            first_emit = True
+            # None: undecided whether the response opens with a reasoning
+            # marker; True: withholding reasoning until "assistantfinal";
+            # False: streaming live.
+            withholding = None
+            for chunk in completion:
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buffer += delta
+                if withholding is None:
+                    stripped = buffer.lstrip()
+                    if stripped.startswith("analysis"):
+                        # Reasoning dump: nothing can be emitted yet, because
+                        # text before "assistantfinal" must never reach the
+                        # consumer and chunks cannot be retracted.
+                        withholding = True
+                    elif any(m.startswith(stripped) for m in self._STREAM_MARKERS):
+                        # Still a prefix of a marker; wait for more input.
+                        continue
+                    else:
+                        withholding = False
+                if withholding:
+                    idx = buffer.find("assistantfinal")
+                    if idx == -1:
+                        continue
+                    emitted = idx + len("assistantfinal")
+                    withholding = False
+                # Text before the last reasoning marker is never emitted.
+                start = 0
+                for marker in self._STREAM_MARKERS:
+                    idx = buffer.rfind(marker)
+                    if idx != -1:
+                        start = max(start, idx + len(marker))
+                emitted = max(emitted, start)
+                # Hold back enough characters that a marker arriving split
+                # across chunk boundaries can still be caught.
+                stable_end = len(buffer) - self._STREAM_HOLDBACK
+                if stable_end > emitted:
+                    segment = buffer[emitted:stable_end]
+                    emitted = stable_end
+                    if first_emit:
+                        # Mirror _clean_output's leading strip of
+                        # whitespace and quotes on the first emission.
+                        segment = segment.lstrip().lstrip('"').lstrip()
+                        if not segment:
+                            continue
+                        first_emit = False
+                    yield segment
+
+            if withholding is False:
+                tail = buffer[emitted:]
+                if first_emit:
+                    tail = tail.lstrip().lstrip('"').lstrip()
+                tail = tail.rstrip().rstrip('"').rstrip()
+                if tail:
+                    yield tail
+            else:
+                # Stream ended while withholding (no "assistantfinal" ever
+                # arrived); resolve the buffer exactly as the non-streaming
+                # path would.
+                final = self._clean_output(buffer)
+                if final:
+                    yield final
+            logger.info("Successfully streamed model response.")
+
+        except Exception as e:
+            logger.exception(f"Error generating streaming response: {e}")
+            yield (
+                "\n\nSomething went wrong while generating a response through API, "
+                "please wait and restart the conversation!"
+            )
+
     def _clean_output(self, content: str) -> str:
         """
         Clean the raw model output to remove reasoning traces or meta text.
@@ -170,14 +355,16 @@ class ModelManager:
         if not content:
             return ""
 
-        # Prefer content after "assistantfinal"
-        if "assistantfinal" in content:
-            content = content.split("assistantfinal", 1)[1]
-
-        # Remove "analysis..." sections if present
-        if "analysis" in content and "assistantfinal" not in content:
-            parts = content.split("analysis", 1)
-            content = parts[-1]
+        # One literal right-to-left scan per marker replaces the previous
+        # in + split passes (each of which rescanned the whole string), and
+        # matches the streaming path by keeping text after the last marker.
+        idx = content.rfind("assistantfinal")
+        if idx != -1:
+            content = content[idx + len("assistantfinal"):]
+        else:
+            idx = content.rfind("analysis")
+            if idx != -1:
+                content = content[idx + len("analysis"):]
 
         # Strip quotes/whitespace
         return content.strip().strip('"').strip()